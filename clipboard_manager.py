@@ -1,17 +1,24 @@
 import json
+import mmap
 import os
+import re
 import sys
 import time
 import uuid
-from dataclasses import dataclass
+from collections import OrderedDict
 from datetime import datetime, timezone
-import html
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import keyboard
 from PySide6 import QtCore, QtGui, QtWidgets
 import winreg
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
+
 
 MAX_ITEMS = 20
 PREVIEW_MAX_CHARS = 140
@@ -19,6 +26,105 @@ PASTE_DELAY_MS = 80
 SMOKE_TEST_AUTOQUIT_MS = 800
 MAX_CLIPBOARD_TEXT_BYTES = 500 * 1024  # 500KB
 CLIPBOARD_DEBOUNCE_MS = 125
+SAVE_DEBOUNCE_MS = 500
+FILTER_DEBOUNCE_MS = 100
+DOC_CACHE_SIZE = 64
+TIME_AGO_BUCKET_SECS = 10
+MMAP_THRESHOLD_BYTES = 256 * 1024
+JOURNAL_COMPACT_FACTOR = 5  # compact the event log once it holds this many events per MAX_ITEMS
+
+# Same output as html.escape(s), in a single pass
+_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+
+# Row markup rendered by RichListDelegate: (number, pin, escaped preview, escaped time)
+_ITEM_HTML = "<div><span>%d. %s%s</span><br><span style='color:#666;font-size:10pt'>%s</span></div>"
+
+
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _load_json_file(path: str):
+    # Big files are parsed straight from a read-only mapping; orjson takes
+    # the buffer without copying it. Small files are cheaper to just read.
+    if orjson is not None and os.path.getsize(path) > MMAP_THRESHOLD_BYTES:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as buf:
+                return orjson.loads(buf)
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
+def _write_atomically(path: str, data: bytes) -> bool:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return True
+    except Exception:
+        # Best-effort save; ignore errors
+        return False
+
+
+class SnapshotWriter:
+    """Writes history snapshots, off the GUI thread when submitted.
+
+    Only one write runs at a time. A snapshot submitted while another is in
+    flight replaces any snapshot still waiting, and a snapshot older than the
+    one already on disk is never written.
+    """
+
+    def __init__(self) -> None:
+        self._state_lock = QtCore.QMutex()
+        self._io_lock = QtCore.QMutex()
+        self._pending = None
+        self._running = False
+        self._written_seq = -1
+
+    def submit(self, seq: int, path: str, data: bytes, cleanup_path: Optional[str] = None) -> None:
+        with QtCore.QMutexLocker(self._state_lock):
+            self._pending = (seq, path, data, cleanup_path)
+            if self._running:
+                return
+            self._running = True
+        QtCore.QThreadPool.globalInstance().start(self._drain)
+
+    def _drain(self) -> None:
+        while True:
+            with QtCore.QMutexLocker(self._state_lock):
+                job = self._pending
+                self._pending = None
+                if job is None:
+                    self._running = False
+                    return
+            self.write(*job)
+
+    def write(self, seq: int, path: str, data: bytes, cleanup_path: Optional[str] = None) -> bool:
+        with QtCore.QMutexLocker(self._io_lock):
+            if seq < self._written_seq:
+                # a newer snapshot is already on disk
+                return True
+            if not _write_atomically(path, data):
+                return False
+            self._written_seq = seq
+        if cleanup_path:
+            try:
+                os.remove(cleanup_path)
+            except OSError:
+                pass
+        return True
 
 
 class GlobalHotkeyManager:
@@ -41,8 +147,9 @@ class GlobalHotkeyManager:
             pass
 
 
-@dataclass(frozen=True)
-class HistoryItem:
+# A NamedTuple rather than a dataclass: immutable, no per-instance __dict__,
+# and still works on Python 3.7 (dataclass slots=True needs 3.10)
+class HistoryItem(NamedTuple):
     id: str
     text: str
     pinned: bool = False
@@ -53,8 +160,17 @@ class ClipboardHistory:
     def __init__(self, max_items: int = MAX_ITEMS, storage_path: Optional[str] = None):
         self.max_items = max_items
         self.storage_path = storage_path or self.default_history_path()
-        self._items: List[HistoryItem] = []
+        self.journal_path = os.path.splitext(self.storage_path)[0] + ".jsonl"
+        # Log parked by a compaction until its snapshot is on disk
+        self._old_journal_path = self.journal_path + ".old"
+        self._writer = SnapshotWriter()
+        # text -> item, in display order (pinned first, then newest)
+        self._items: "OrderedDict[str, HistoryItem]" = OrderedDict()
         self._ignore_next: Optional[str] = None
+        # Append-only event log; replayed on top of the last full snapshot
+        self._journal = None
+        self._journal_lines = 0
+        self._seq = 0
 
     # -------- persistence helpers --------
     @staticmethod
@@ -70,51 +186,165 @@ class ClipboardHistory:
 
     def load(self) -> None:
         path = self.storage_path
-        if not path or not os.path.exists(path):
+        if not path:
+            return
+        if os.path.exists(path):
+            try:
+                data = _load_json_file(path)
+                items: List[HistoryItem] = []
+                for row in (data.get("items") or []):
+                    text = (row.get("text") or "").strip("\r\n")
+                    if not text:
+                        continue
+                    item_id = str(row.get("id") or "").strip() or uuid.uuid4().hex
+                    pinned = bool(row.get("pinned", False))
+                    ts = float(row.get("ts", 0.0) or 0.0)
+                    if ts <= 0:
+                        ts = time.time()
+                    items.append(HistoryItem(id=item_id, text=text, pinned=pinned, ts=ts))
+                self.set_items(items)
+                self._seq = int(data.get("seq", 0) or 0)
+            except Exception:
+                # Keep going silently; best-effort load
+                pass
+        self._replay_journal(self._old_journal_path)
+        self._replay_journal(self.journal_path)
+        if os.path.exists(self._old_journal_path):
+            # Left behind by a crash mid-compaction; fold it into a snapshot now
+            # or _compact() would stay blocked for the whole session
+            self.save()
+
+    def _replay_journal(self, path: str) -> None:
+        if not os.path.exists(path):
             return
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            items: List[HistoryItem] = []
-            for row in (data.get("items") or []):
-                text = (row.get("text") or "").strip("\r\n")
-                if not text:
+            with open(path, "rb") as f:
+                raw = f.read()
+            if raw and not raw.endswith(b"\n"):
+                # Cut a torn last line off so the next append starts on a fresh line
+                raw = raw[:raw.rfind(b"\n") + 1]
+                with open(path, "r+b") as f:
+                    f.truncate(len(raw))
+            lines = raw.splitlines()
+        except Exception:
+            return
+        for line in lines:
+            try:
+                event = _json_loads(line)
+                seq = int(event.get("seq", 0))
+                if seq <= self._seq:
+                    # already part of the snapshot
                     continue
-                item_id = str(row.get("id") or "").strip() or uuid.uuid4().hex
-                pinned = bool(row.get("pinned", False))
-                ts = float(row.get("ts", 0.0) or 0.0)
-                if ts <= 0:
-                    ts = time.time()
-                items.append(HistoryItem(id=item_id, text=text, pinned=pinned, ts=ts))
-            self.set_items(items)
+                self._apply_event(event)
+                self._seq = seq
+            except Exception:
+                # Skip unreadable lines; best-effort replay
+                continue
+        self._journal_lines += len(lines)
+
+    def _apply_event(self, event: dict) -> None:
+        op = event.get("op")
+        if op == "add":
+            ts = float(event.get("ts", 0.0) or 0.0) or time.time()
+            self._put(HistoryItem(id=str(event["id"]), text=str(event["text"]), pinned=bool(event.get("pinned", False)), ts=ts))
+        elif op == "pin":
+            self._set_pinned(str(event["id"]), bool(event.get("pinned", False)))
+        elif op == "remove":
+            self._remove_id(str(event.get("id")))
+        elif op == "clear":
+            self._items.clear()
+
+    def append_event(self, op: str, **fields) -> None:
+        path = self.journal_path
+        if not path:
+            return
+        self._seq += 1
+        event = {"seq": self._seq, "op": op}
+        event.update(fields)
+        try:
+            if self._journal is None:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                self._journal = open(path, "ab")
+            self._journal.write(_json_dumps(event) + b"\n")
+            self._journal_lines += 1
         except Exception:
-            # Keep going silently; best-effort load
+            # Best-effort; the next full save() still captures the state
             pass
 
-    def save(self) -> None:
-        path = self.storage_path
-        if not path:
+    def flush(self) -> None:
+        # Push buffered events to disk, compacting the log when it grew too long
+        if self._journal_lines > JOURNAL_COMPACT_FACTOR * self.max_items and self._compact():
             return
+        try:
+            if self._journal is not None:
+                self._journal.flush()
+        except Exception:
+            pass
+
+    def _close_journal(self) -> None:
+        try:
+            if self._journal is not None:
+                self._journal.close()
+        except Exception:
+            pass
+        self._journal = None
+
+    def _compact(self) -> bool:
+        # Still waiting on the previous compaction; its parked log must survive
+        if os.path.exists(self._old_journal_path):
+            return False
+        data = self._snapshot()
+        if data is None:
+            return False
+        # Park the current log so new events go to a fresh file meanwhile
+        self._close_journal()
+        try:
+            os.replace(self.journal_path, self._old_journal_path)
+        except OSError:
+            pass
+        self._journal_lines = 0
+        self._writer.submit(self._seq, self.storage_path, data, cleanup_path=self._old_journal_path)
+        return True
+
+    def _reset_journal(self) -> None:
+        # Everything up to self._seq is in the snapshot now
+        self._close_journal()
+        for path in (self.journal_path, self._old_journal_path):
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except Exception:
+                pass
+        self._journal_lines = 0
+
+    def _snapshot(self) -> Optional[bytes]:
         payload = {
             "version": 1,
+            "seq": self._seq,
             "saved_at": datetime.now(timezone.utc).isoformat(),
             "items": [{"id": it.id, "text": it.text, "pinned": it.pinned, "ts": it.ts} for it in self.items()],
         }
         try:
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            tmp_path = f"{path}.tmp"
-            with open(tmp_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False, indent=2)
-                f.flush()
-                os.fsync(f.fileno())
-            os.replace(tmp_path, path)
+            return _json_dumps(payload)
         except Exception:
-            # Best-effort save; ignore errors
-            pass
+            # e.g. lone surrogates in clipboard text; leave the journal as is
+            return None
+
+    def save(self) -> None:
+        path = self.storage_path
+        if not path:
+            return
+        data = self._snapshot()
+        if data is None:
+            return
+        # Synchronous; waits for any in-flight background write first
+        if not self._writer.write(self._seq, path, data):
+            return
+        self._reset_journal()
 
     # -------- in-memory operations --------
     def items(self) -> List[HistoryItem]:
-        return list(self._items)
+        return list(self._items.values())
 
     def set_items(self, items: List[HistoryItem]) -> None:
         # Ensure ordering: pinned first, then newest; pinned are never trimmed
@@ -126,7 +356,7 @@ class ClipboardHistory:
         remaining_slots = max(0, self.max_items - len(pinned))
         keep_unpinned = [] if remaining_slots == 0 else unpinned[:remaining_slots]
         # pinned can exceed max_items; they are preserved
-        self._items = pinned + keep_unpinned
+        self._items = OrderedDict((it.text, it) for it in pinned + keep_unpinned)
 
     def set_ignore_next(self, value: str) -> None:
         self._ignore_next = value
@@ -142,31 +372,60 @@ class ClipboardHistory:
 
         now = time.time()
 
-        # Move-to-front dedupe; preserve pinned if it already exists
-        existing = next((it for it in self._items if it.text == value), None)
+        # Preserve id and pinned state if the text already exists
+        existing = self._items.get(value)
         existing_id = existing.id if existing else uuid.uuid4().hex
         pinned = bool(existing.pinned) if existing else False
-        self._items = [it for it in self._items if it.text != value]
-        self._items.insert(0, HistoryItem(id=existing_id, text=value, pinned=pinned, ts=now))
+        item = HistoryItem(id=existing_id, text=value, pinned=pinned, ts=now)
+        self._put(item)
+        self.append_event("add", id=item.id, text=item.text, pinned=item.pinned, ts=item.ts)
+        return True
+
+    def _put(self, item: HistoryItem) -> None:
+        # Move-to-front dedupe; the rest is already in display order
+        self._items.pop(item.text, None)
+        self._items[item.text] = item
+        self._items.move_to_end(item.text, last=False)
 
         # Keep pinned items at the top
-        self.set_items(self._items)
-        return True
+        pinned = [t for t, it in self._items.items() if it.pinned]
+        if not item.pinned:
+            for text in reversed(pinned):
+                self._items.move_to_end(text, last=False)
+
+        # Unpinned items sit at the end, oldest last; pinned are never trimmed
+        remaining_slots = max(0, self.max_items - len(pinned))
+        for _ in range(len(self._items) - len(pinned) - remaining_slots):
+            self._items.popitem(last=True)
 
     def toggle_pin(self, item_id: str) -> None:
+        existing = next((it for it in self._items.values() if it.id == item_id), None)
+        if existing is None:
+            return
+        self._set_pinned(item_id, not existing.pinned)
+        self.append_event("pin", id=item_id, pinned=not existing.pinned)
+
+    def _set_pinned(self, item_id: str, pinned: bool) -> None:
         updated: List[HistoryItem] = []
-        for it in self._items:
+        for it in self._items.values():
             if it.id == item_id:
-                updated.append(HistoryItem(id=it.id, text=it.text, pinned=not it.pinned, ts=it.ts or time.time()))
+                updated.append(HistoryItem(id=it.id, text=it.text, pinned=pinned, ts=it.ts or time.time()))
             else:
                 updated.append(it)
         self.set_items(updated)
 
+    def _remove_id(self, item_id: str) -> None:
+        text = next((t for t, it in self._items.items() if it.id == item_id), None)
+        if text is not None:
+            del self._items[text]
+
     def remove(self, item_id: str) -> None:
-        self._items = [it for it in self._items if it.id != item_id]
+        self._remove_id(item_id)
+        self.append_event("remove", id=item_id)
 
     def clear(self) -> None:
-        self._items = []
+        self._items.clear()
+        self.append_event("clear")
 
     def export_to_text(self) -> str:
         lines: List[str] = []
@@ -184,15 +443,26 @@ class ClipboardHistory:
 class AutostartManager:
     RUN_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
     VALUE_NAME = "MiniClipboardManager"
+    # Registry lookups are not free; the value only changes through set_enabled
+    _cached: Optional[bool] = None
+    _cached_command: Optional[str] = None
 
-    @staticmethod
-    def _command() -> str:
-        script = os.path.abspath(sys.argv[0])
-        exe = sys.executable
-        return f"\"{exe}\" \"{script}\""
+    @classmethod
+    def _command(cls) -> str:
+        if cls._cached_command is None:
+            script = os.path.abspath(sys.argv[0])
+            exe = sys.executable
+            cls._cached_command = f"\"{exe}\" \"{script}\""
+        return cls._cached_command
 
     @classmethod
     def is_enabled(cls) -> bool:
+        if cls._cached is None:
+            cls._cached = cls._query_enabled()
+        return cls._cached
+
+    @classmethod
+    def _query_enabled(cls) -> bool:
         try:
             with winreg.OpenKey(winreg.HKEY_CURRENT_USER, cls.RUN_KEY, 0, winreg.KEY_READ) as k:
                 v, _t = winreg.QueryValueEx(k, cls.VALUE_NAME)
@@ -213,23 +483,34 @@ class AutostartManager:
                         winreg.DeleteValue(k, cls.VALUE_NAME)
                     except FileNotFoundError:
                         pass
+            cls._cached = enabled
             return None
         except Exception as e:
             return e
 
 
 def format_time_ago(ts: float) -> str:
+    now = time.time()
     try:
-        dt = datetime.fromtimestamp(ts, tz=timezone.utc)
-    except Exception:
+        secs = int(now - ts)
+    except (ValueError, OverflowError):
         return ""
-    now = datetime.now(timezone.utc)
-    delta = now - dt
-    secs = int(delta.total_seconds())
     if secs < 0:
         secs = 0
     if secs < 60:
         return f"{secs}s ago"
+    # Coarser labels only change every so often; share them across refreshes
+    return _format_time_ago(int(ts), int(now) // TIME_AGO_BUCKET_SECS)
+
+
+@lru_cache(maxsize=256)
+def _format_time_ago(ts: int, now_bucket: int) -> str:
+    try:
+        dt = datetime.fromtimestamp(ts, tz=timezone.utc)
+    except Exception:
+        return ""
+    now = datetime.fromtimestamp(now_bucket * TIME_AGO_BUCKET_SECS, tz=timezone.utc)
+    secs = max(60, int((now - dt).total_seconds()))
     mins = secs // 60
     if mins < 60:
         return f"{mins} min ago"
@@ -242,6 +523,27 @@ def format_time_ago(ts: float) -> str:
 
 
 class RichListDelegate(QtWidgets.QStyledItemDelegate):
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        # html -> parsed document, least recently used first
+        self._docs: "OrderedDict[str, QtGui.QTextDocument]" = OrderedDict()
+
+    def _document(self, index: QtCore.QModelIndex) -> QtGui.QTextDocument:
+        html_text = index.data(QtCore.Qt.ItemDataRole.UserRole + 10) or ""
+        doc = self._docs.get(html_text)
+        if doc is not None:
+            self._docs.move_to_end(html_text)
+            return doc
+        doc = QtGui.QTextDocument()
+        doc.setHtml(html_text)
+        self._docs[html_text] = doc
+        if len(self._docs) > DOC_CACHE_SIZE:
+            self._docs.popitem(last=False)
+        return doc
+
+    def clear_cache(self) -> None:
+        self._docs.clear()
+
     def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> None:
         painter.save()
         opt = QtWidgets.QStyleOptionViewItem(option)
@@ -250,8 +552,7 @@ class RichListDelegate(QtWidgets.QStyledItemDelegate):
         style = opt.widget.style() if opt.widget else QtWidgets.QApplication.style()
         style.drawPrimitive(QtWidgets.QStyle.PrimitiveElement.PE_PanelItemViewItem, opt, painter, opt.widget)
 
-        doc = QtGui.QTextDocument()
-        doc.setHtml(index.data(QtCore.Qt.ItemDataRole.UserRole + 10) or "")
+        doc = self._document(index)
         doc.setTextWidth(opt.rect.width() - 12)
 
         ctx = QtGui.QAbstractTextDocumentLayout.PaintContext()
@@ -263,8 +564,7 @@ class RichListDelegate(QtWidgets.QStyledItemDelegate):
         painter.restore()
 
     def sizeHint(self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> QtCore.QSize:
-        doc = QtGui.QTextDocument()
-        doc.setHtml(index.data(QtCore.Qt.ItemDataRole.UserRole + 10) or "")
+        doc = self._document(index)
         doc.setTextWidth(max(10, option.rect.width() - 12))
         return QtCore.QSize(int(doc.idealWidth()) + 12, int(doc.size().height()) + 8)
 
@@ -283,11 +583,22 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setMinimumSize(520, 360)
 
         self.history = ClipboardHistory(MAX_ITEMS)
+        # item id -> (preview, escaped preview); an id's text never changes
+        self._preview_cache: Dict[str, Tuple[str, str]] = {}
         self._last_clipboard: Optional[str] = None
         self._clipboard_debounce = QtCore.QTimer(self)
         self._clipboard_debounce.setSingleShot(True)
         self._clipboard_debounce.setInterval(CLIPBOARD_DEBOUNCE_MS)
         self._clipboard_debounce.timeout.connect(self._process_clipboard_change)
+        # Coalesce history writes; bursts of copies only hit the disk once
+        self._save_debounce = QtCore.QTimer(self)
+        self._save_debounce.setSingleShot(True)
+        self._save_debounce.setInterval(SAVE_DEBOUNCE_MS)
+        self._save_debounce.timeout.connect(self._do_save)
+        self._filter_debounce = QtCore.QTimer(self)
+        self._filter_debounce.setSingleShot(True)
+        self._filter_debounce.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_debounce.timeout.connect(self._refresh_list)
 
         self._build_ui()
         self.history.load()
@@ -380,7 +691,10 @@ class MainWindow(QtWidgets.QMainWindow):
         search_row.addWidget(self.search_edit, 1)
 
         self.list_widget = QtWidgets.QListWidget()
-        self.list_widget.setItemDelegate(RichListDelegate(self.list_widget))
+        self._delegate = RichListDelegate(self.list_widget)
+        self.list_widget.setItemDelegate(self._delegate)
+        # Row heights come from the delegate and vary per item
+        self.list_widget.setUniformItemSizes(False)
         self.list_widget.itemDoubleClicked.connect(self._on_item_activated)
         self.list_widget.itemActivated.connect(self._on_item_activated)
         self.list_widget.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
@@ -430,7 +744,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self._apply_theme()
 
     def _on_filter_changed(self, _text: str) -> None:
-        self._refresh_list()
+        # Rebuild once the user pauses typing
+        self._filter_debounce.start()
 
     def _on_item_activated(self, _item: QtWidgets.QListWidgetItem) -> None:
         self.copy_and_paste_selected()
@@ -500,86 +815,145 @@ class MainWindow(QtWidgets.QMainWindow):
         self._clipboard_debounce.start()
 
     def _process_clipboard_change(self) -> None:
-        md = self._clipboard.mimeData()
-        if md is None or not md.hasText():
+        # text() only asks the OS for the text format, unlike mimeData()
+        current = self._clipboard.text()
+        if not current:
             return
-        current = md.text()
-        try:
-            if len(current.encode("utf-8", errors="ignore")) > MAX_CLIPBOARD_TEXT_BYTES:
-                return
-        except Exception:
+        # UTF-8 needs 1-4 bytes per character; only encode when the length alone can't decide
+        n = len(current)
+        if n > MAX_CLIPBOARD_TEXT_BYTES:
             return
+        if n * 4 > MAX_CLIPBOARD_TEXT_BYTES:
+            try:
+                if len(current.encode("utf-8", errors="ignore")) > MAX_CLIPBOARD_TEXT_BYTES:
+                    return
+            except Exception:
+                return
         if current != self._last_clipboard:
             self._last_clipboard = current
             if self.history.add(current):
                 self._refresh_list()
-                self.history.save()
+                self._save_debounce.start()
+
+    def _do_save(self) -> None:
+        self.history.flush()
+
+    def _preview_for(self, it: HistoryItem) -> Tuple[str, str]:
+        cached = self._preview_cache.get(it.id)
+        if cached is not None:
+            return cached
+        raw = it.text
+        lines = raw.splitlines() or [raw]
+        first = lines[0]
+        extra_lines = max(0, len(lines) - 1)
+        preview = first
+        if extra_lines:
+            preview += f"  (＋{extra_lines} lines)"
+        preview = preview.strip()
+        if len(preview) > PREVIEW_MAX_CHARS:
+            preview = preview[:PREVIEW_MAX_CHARS] + "…"
+        cached = (preview, preview.translate(_ESCAPE_TABLE))
+        self._preview_cache[it.id] = cached
+        return cached
 
     def _refresh_list(self) -> None:
+        # Apply every row change before the view repaints or relayouts
+        lw = self.list_widget
+        lw.setUpdatesEnabled(False)
+        lw.blockSignals(True)
+        try:
+            self._sync_list_rows()
+        finally:
+            lw.blockSignals(False)
+            lw.setUpdatesEnabled(True)
+            lw.viewport().update()
+
+    def _sync_list_rows(self) -> None:
         items = self.history.items()
+        if len(self._preview_cache) > len(items):
+            # Drop previews of removed/evicted items
+            live = {it.id for it in items}
+            self._preview_cache = {k: v for k, v in self._preview_cache.items() if k in live}
         q = (self.search_edit.text() or "").strip().lower()
         if q:
             items = [x for x in items if q in x.text.lower()]
+        pat = re.compile(re.escape(q), re.IGNORECASE) if q else None
+
+        # Resolve enum/global lookups once rather than per row
+        role_id = int(QtCore.Qt.ItemDataRole.UserRole)
+        role_pinned, role_ts, role_text, role_html = role_id + 1, role_id + 2, role_id + 3, role_id + 10
+        table = _ESCAPE_TABLE
+        template = _ITEM_HTML
 
         prev_row = self.list_widget.currentRow()
-        self.list_widget.clear()
 
         for i, it in enumerate(items):
-            raw = it.text
-            lines = raw.splitlines() or [raw]
-            first = lines[0]
-            extra_lines = max(0, len(lines) - 1)
-            preview = first
-            if extra_lines:
-                preview += f"  (＋{extra_lines} lines)"
-            preview = preview.strip()
-            if len(preview) > PREVIEW_MAX_CHARS:
-                preview = preview[:PREVIEW_MAX_CHARS] + "…"
+            preview, escaped = self._preview_for(it)
 
             pin = "⭐ " if it.pinned else ""
             when = format_time_ago(it.ts)
 
             # Highlight search matches inside preview
-            escaped = html.escape(preview)
-            if q:
-                # simple case-insensitive highlight
-                low = preview.lower()
-                start = low.find(q)
-                if start >= 0:
-                    end = start + len(q)
-                    escaped = (
-                        html.escape(preview[:start])
-                        + '<span style="background-color:#ffe58f;">'
-                        + html.escape(preview[start:end])
-                        + "</span>"
-                        + html.escape(preview[end:])
-                    )
-
-            html_text = (
-                f"<div>"
-                f"<span>{i+1}. {html.escape(pin)}{escaped}</span>"
-                f"<br><span style='color:#666;font-size:10pt'>{html.escape(when)}</span>"
-                f"</div>"
-            )
-
-            item = QtWidgets.QListWidgetItem("")  # rendered by delegate
-            item.setData(QtCore.Qt.ItemDataRole.UserRole, it.id)
-            item.setData(QtCore.Qt.ItemDataRole.UserRole + 3, it.text)
-            item.setData(QtCore.Qt.ItemDataRole.UserRole + 1, it.pinned)
-            item.setData(QtCore.Qt.ItemDataRole.UserRole + 2, it.ts)
-            item.setData(QtCore.Qt.ItemDataRole.UserRole + 10, html_text)
-            self.list_widget.addItem(item)
+            m = pat.search(preview) if pat is not None else None
+            if m is not None:
+                start, end = m.span()
+                escaped = (
+                    preview[:start].translate(table)
+                    + '<span style="background-color:#ffe58f;">'
+                    + preview[start:end].translate(table)
+                    + "</span>"
+                    + preview[end:].translate(table)
+                )
+
+            html_text = template % (i + 1, pin.translate(table), escaped, when.translate(table))
+
+            # Reuse the row's widget item when possible instead of rebuilding the list
+            item = self._take_row_item(i, it.id, role_id)
+            for role, value in (
+                (role_id, it.id),
+                (role_text, it.text),
+                (role_pinned, it.pinned),
+                (role_ts, it.ts),
+                (role_html, html_text),
+            ):
+                if item.data(role) != value:
+                    item.setData(role, value)
+
+        while self.list_widget.count() > len(items):
+            self.list_widget.takeItem(self.list_widget.count() - 1)
 
         if self.list_widget.count() > 0:
             self.list_widget.setCurrentRow(max(0, min(prev_row, self.list_widget.count() - 1)))
 
+    def _take_row_item(self, row: int, item_id: str, role_id: int) -> QtWidgets.QListWidgetItem:
+        # Returns the widget item for item_id, moved to `row` (created if missing)
+        current = self.list_widget.item(row)
+        if current is not None and current.data(role_id) == item_id:
+            return current
+        for r in range(row + 1, self.list_widget.count()):
+            if self.list_widget.item(r).data(role_id) == item_id:
+                item = self.list_widget.takeItem(r)
+                break
+        else:
+            item = QtWidgets.QListWidgetItem("")  # rendered by delegate
+        self.list_widget.insertItem(row, item)
+        return item
+
+    def _apply_pending_filter(self) -> None:
+        # A debounced filter edit may not be on screen yet; act on what was typed
+        if self._filter_debounce.isActive():
+            self._filter_debounce.stop()
+            self._refresh_list()
+
     def _selected_history_item(self) -> Optional[str]:
+        self._apply_pending_filter()
         item = self.list_widget.currentItem()
         if item is None:
             return None
         return item.data(QtCore.Qt.ItemDataRole.UserRole)
 
     def _selected_history_text(self) -> Optional[str]:
+        self._apply_pending_filter()
         item = self.list_widget.currentItem()
         if item is None:
             return None
@@ -636,6 +1010,9 @@ class MainWindow(QtWidgets.QMainWindow):
         if item_id is None:
             return
         self.history.remove(item_id)
+        # Rewrite the snapshot now so the removed text leaves the disk too
+        self.history.save()
+        self._save_debounce.start()
         self._refresh_list()
 
     def toggle_pin_selected(self) -> None:
@@ -643,7 +1020,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if item_id is None:
             return
         self.history.toggle_pin(item_id)
-        self.history.save()
+        self._save_debounce.start()
         self._refresh_list()
 
     def _show_item_menu(self, pos: QtCore.QPoint) -> None:
@@ -687,7 +1064,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def clear_history(self) -> None:
         self.history.clear()
+        # Users clear history to get rid of secrets; don't leave them on disk
         self.history.save()
+        self._save_debounce.start()
         self._refresh_list()
 
     def _restore_window_position(self) -> None:
@@ -704,11 +1083,14 @@ class MainWindow(QtWidgets.QMainWindow):
     def _on_about_to_quit(self) -> None:
         # Called for tray exit, Alt+F4, etc.
         self._save_window_position()
+        self._save_debounce.stop()
         self.history.save()
+        self._delegate.clear_cache()
         self._shutdown_hotkeys()
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         self._save_window_position()
+        self._save_debounce.stop()
         self.history.save()
         event.accept()
 